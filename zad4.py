@@ -1,5 +1,11 @@
 import math
+from functools import lru_cache
 
+import numpy as np
+
+from zestaw1.rates_core import periodic_from_effective
+
+@lru_cache(maxsize=256)
 def calculate_equivalent_periodic_rate(annual_effective_rate, n):
     """
     Calculates the equivalent effective periodic (quarterly, monthly...) rate
@@ -10,13 +16,29 @@ def calculate_equivalent_periodic_rate(annual_effective_rate, n):
     
     Solving for y_periodic:
     y_periodic = (1 + y_annual)^(1/n) - 1
+    
+    Evaluated as expm1(log1p(y_annual) / n) to avoid cancellation for small rates.
     """
     if n <= 0:
         raise ValueError("Number of compounding periods 'n' must be positive.")
     
-    y_periodic = pow(1 + annual_effective_rate, 1/n) - 1
+    y_periodic = math.expm1(math.log1p(annual_effective_rate) / n)
     return y_periodic
 
+def calculate_equivalent_periodic_rates(annual_effective_rate, ns):
+    """
+    Vectorized counterpart of calculate_equivalent_periodic_rate: evaluates
+    y_periodic = (1 + y_annual)^(1/n) - 1 for a whole array of periods
+    per year 'ns' in a single pass of the compiled
+    rates_core.periodic_from_effective kernel.
+    """
+    ns = np.asarray(ns, dtype=np.float64)
+    if np.any(ns <= 0):
+        raise ValueError("Number of compounding periods 'n' must be positive.")
+    
+    return periodic_from_effective(annual_effective_rate, ns)
+
+@lru_cache(maxsize=256)
 def calculate_equivalent_continuous_rate(annual_effective_rate):
     """
     Calculates the equivalent effective continuous rate 'r' for a
@@ -28,7 +50,7 @@ def calculate_equivalent_continuous_rate(annual_effective_rate):
     Solving for r:
     r = ln(1 + y)
     """
-    r = math.log(1 + annual_effective_rate)
+    r = math.log1p(annual_effective_rate)
     return r
 
 def main():
@@ -45,8 +67,8 @@ def main():
         "Daily": 365
     }
         
-    for name, n in periodic_calcs.items():
-        y_p = calculate_equivalent_periodic_rate(Y_ANNUAL, n)
+    y_ps = calculate_equivalent_periodic_rates(Y_ANNUAL, list(periodic_calcs.values()))
+    for name, y_p in zip(periodic_calcs, y_ps):
         print(f"Equivalent {name:<10} rate (y_p): {y_p * 100:.6f}%")
     
     print("\n--- Part (b): Equivalent Effective Continuous Rate ---")
@@ -20,16 +20,17 @@ def calculate_simple_interest_payment(fv, years, rate, payments_per_year):
     return math.ceil(a * 100) / 100
 
 
-def calculate_compound_interest_payment_loop(fv, years, rate, payments_per_year):
+def calculate_compound_interest_payment(fv, years, rate, payments_per_year):
     total_payments_num = years * payments_per_year
     rate_divided = rate / payments_per_year
 
-    denominator = 1
     multiplier = rate_divided + 1
-    for _ in range(total_payments_num):
-        # adding interest for the quarter just ended (denominator * multiplier) and adding quarterly contribution fo beginning quarter (+ 1)
-        denominator = denominator * multiplier + 1
-    denominator -= 1
+    # the denominator is the geometric series multiplier + multiplier^2 + ... + multiplier^total_payments_num,
+    # summed in closed form with a single pow instead of one iteration per payment
+    if multiplier != 1:
+        denominator = multiplier * (multiplier ** total_payments_num - 1) / (multiplier - 1)
+    else:
+        denominator = total_payments_num # Handle zero interest case
 
     # REASONING:
     #             |      Q1      |        Q2       |        Q3       | ..... |     Q(LAST)   |
@@ -40,6 +41,8 @@ def calculate_compound_interest_payment_loop(fv, years, rate, payments_per_year)
     # fv = ( ...(((multiplier + 1) * multiplier + 1) * multiplier + 1) ... ) * a * multiplier
     # fv = ( ...(((multiplier + 1) * multiplier + 1) * multiplier + 1) ... ) * multiplier * a
     # a = fv / (( ...(((multiplier + 1) * multiplier + 1) * multiplier + 1) ... ) * multiplier)
+    # a = fv / (multiplier + multiplier^2 + ... + multiplier^total_payments_num)
+    # a = fv / (multiplier * (multiplier^total_payments_num - 1) / (multiplier - 1))
 
     a = fv / denominator
     return math.ceil(a * 100) / 100
@@ -57,7 +60,7 @@ simple_interest_payment = calculate_simple_interest_payment(
     payments_per_year=quarterly_payments_per_year
 )
 
-compound_interest_payment = calculate_compound_interest_payment_loop(
+compound_interest_payment = calculate_compound_interest_payment(
     fv=future_value,
     years=investment_years,
     rate=savings_annual_rate,
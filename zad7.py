@@ -1,19 +1,61 @@
 import math
+import sys
+from functools import lru_cache
 
-def print_schedule(name, schedule, total_interest):
+import numpy as np
+
+# Struct-of-Arrays layout of an amortization schedule: one field per column, one element per period
+SCHEDULE_DTYPE = np.dtype([
+    ('period', 'i4'),
+    ('initial_principal', 'f8'),
+    ('total_payment', 'f8'),
+    ('interest_payment', 'f8'),
+    ('principal_payment', 'f8')
+])
+
+# print_schedule writes its rows in blocks of this size rather than one print() per row
+PRINT_BLOCK_ROWS = 256
+
+def print_schedule(name, schedule):
     """
     Helper function for printing schedules
+    
+    Accepts any iterable of (period, initial_principal, total_payment, interest_payment,
+    principal_payment) rows - a schedule array or one of the iter_*_schedule generators -
+    and returns the total interest accumulated while printing.
     """
-    print(f"\n--- Amortization Schedule: {name} ---")
-    print("=" * 80)
-    print(f"{'Period':<8} | {'Initial Principal':<18} | {'Total Payment (CF)':<18} | {'Interest Payment':<18} | {'Principal Payment':<18}")
-    print("-" * 80)
+    # Rows are buffered and written PRINT_BLOCK_ROWS at a time, so output costs one
+    # write per block while the buffer stays bounded however long the schedule is
+    lines = [
+        f"\n--- Amortization Schedule: {name} ---",
+        "=" * 80,
+        f"{'Period':<8} | {'Initial Principal':<18} | {'Total Payment (CF)':<18} | {'Interest Payment':<18} | {'Principal Payment':<18}",
+        "-" * 80
+    ]
+    format_row = "{:<8} | {:<18,.2f} | {:<18,.2f} | {:<18,.2f} | {:<18,.2f}".format
     
-    for row in schedule:
-        print(f"{row['period']:<8} | {row['initial_principal']:<18,.2f} | {row['total_payment']:<18,.2f} | {row['interest_payment']:<18,.2f} | {row['principal_payment']:<18,.2f}")
+    # Neumaier (improved Kahan) summation keeps the running total accurate without
+    # holding on to the rows
+    total_interest = 0.0
+    compensation = 0.0
+    for period, initial_principal, total_payment, interest_payment, principal_payment in schedule:
+        t = total_interest + interest_payment
+        if abs(total_interest) >= abs(interest_payment):
+            compensation += (total_interest - t) + interest_payment
+        else:
+            compensation += (interest_payment - t) + total_interest
+        total_interest = t
+        lines.append(format_row(period, initial_principal, total_payment, interest_payment, principal_payment))
+        if len(lines) >= PRINT_BLOCK_ROWS:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
     
-    print("=" * 80)
-    print(f"Total Interest Paid: {total_interest:,.2f} PLN\n")
+    total_interest += compensation
+    
+    lines.append("=" * 80)
+    lines.append(f"Total Interest Paid: {total_interest:,.2f} PLN\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return total_interest
 
 def calculate_constant_principal_schedule(P, r_pa, T_years, n_per_year):
     """
@@ -21,9 +63,30 @@ def calculate_constant_principal_schedule(P, r_pa, T_years, n_per_year):
     
     The principal payment is constant, and interest is paid on the outstanding balance.
     """
-    schedule = []
-    total_interest = 0
+    r_p = r_pa / n_per_year  # Periodic interest rate (per quarter)
+    N = T_years * n_per_year # Total number of periods
+    
+    principal_payment = P / N # Constant principal payment
+    
+    schedule = np.empty(N, dtype=SCHEDULE_DTYPE)
+    schedule['period'] = np.arange(1, N + 1)
     
+    # Outstanding balance at the start of period k: B_{k-1} = P - (k-1) * principal_payment
+    schedule['initial_principal'] = P - (schedule['period'] - 1) * principal_payment
+    schedule['interest_payment'] = schedule['initial_principal'] * r_p
+    schedule['principal_payment'] = principal_payment
+    schedule['total_payment'] = principal_payment + schedule['interest_payment']
+    total_interest = math.fsum(schedule['interest_payment'].tolist())
+        
+    return schedule, total_interest
+
+def iter_constant_principal_schedule(P, r_pa, T_years, n_per_year):
+    """
+    Generator counterpart of calculate_constant_principal_schedule.
+    
+    Yields one (period, initial_principal, total_payment, interest_payment, principal_payment)
+    row at a time, so printing or exporting a long schedule needs O(1) memory.
+    """
     r_p = r_pa / n_per_year  # Periodic interest rate (per quarter)
     N = T_years * n_per_year # Total number of periods
     
@@ -32,20 +95,20 @@ def calculate_constant_principal_schedule(P, r_pa, T_years, n_per_year):
     
     for k in range(1, N + 1):
         interest_payment = current_principal * r_p
-        total_payment = principal_payment + interest_payment
-        
-        schedule.append({
-            'period': k,
-            'initial_principal': current_principal,
-            'total_payment': total_payment,
-            'interest_payment': interest_payment,
-            'principal_payment': principal_payment
-        })
-        
-        total_interest += interest_payment
+        yield k, current_principal, principal_payment + interest_payment, interest_payment, principal_payment
         current_principal -= principal_payment
-        
-    return schedule, total_interest
+
+def calculate_annuity_payment(P, r_p, N):
+    """
+    Calculates the constant periodic payment (PMT) using the
+    Present Value of an Annuity (PVA) formula: P = PMT * [ (1 - (1+r_p)^-N) / r_p ]
+    
+    1 - (1+r_p)^-N is evaluated as -expm1(-N * log1p(r_p)), which stays accurate as
+    r_p -> 0 and only vanishes at exactly zero interest.
+    """
+    # Solved for PMT:
+    denominator = -math.expm1(-N * math.log1p(r_p))
+    return P * r_p / denominator if denominator != 0 else P / N # Handle zero interest case
 
 def calculate_annuity_schedule(P, r_pa, T_years, n_per_year):
     """
@@ -53,47 +116,62 @@ def calculate_annuity_schedule(P, r_pa, T_years, n_per_year):
     
     We first find the constant payment PMT using the PVA formula.
     """
-    schedule = []
-    total_interest = 0
-    
     r_p = r_pa / n_per_year  # Periodic interest rate (per quarter)
     N = T_years * n_per_year # Total number of periods
     
-    # Calculate the constant periodic payment (PMT) using the
-    # Present Value of an Annuity (PVA) formula: P = PMT * [ (1 - (1+r_p)^-N) / r_p ]
-    # Solved for PMT:
-    if r_p > 0:
-        total_payment = P * (r_p / (1 - math.pow(1 + r_p, -N)))
+    total_payment = calculate_annuity_payment(P, r_p, N)
+        
+    schedule = np.empty(N, dtype=SCHEDULE_DTYPE)
+    schedule['period'] = np.arange(1, N + 1)
+    
+    # Outstanding balance at the start of period k, in closed form:
+    # B_{k-1} = P * (1+r_p)^(k-1) - PMT * ((1+r_p)^(k-1) - 1) / r_p
+    #         = P - (PMT - P * r_p) * ((1+r_p)^(k-1) - 1) / r_p
+    # with (1+r_p)^(k-1) - 1 = expm1((k-1) * log1p(r_p)); the growth sum tends to k-1 as r_p -> 0
+    periods_paid = schedule['period'] - 1
+    if r_p != 0:
+        growth_sum = np.expm1(periods_paid * math.log1p(r_p)) / r_p
     else:
-        total_payment = P / N # Handle zero interest case
+        growth_sum = periods_paid # Handle zero interest case
+    schedule['initial_principal'] = P - (total_payment - P * r_p) * growth_sum
+    schedule['interest_payment'] = schedule['initial_principal'] * r_p
+    schedule['total_payment'] = total_payment
+    schedule['principal_payment'] = total_payment - schedule['interest_payment']
+    total_interest = math.fsum(schedule['interest_payment'].tolist())
         
+    return schedule, total_interest
+
+def iter_annuity_schedule(P, r_pa, T_years, n_per_year):
+    """
+    Generator counterpart of calculate_annuity_schedule.
+    
+    Yields one (period, initial_principal, total_payment, interest_payment, principal_payment)
+    row at a time, so printing or exporting a long schedule needs O(1) memory.
+    """
+    r_p = r_pa / n_per_year  # Periodic interest rate (per quarter)
+    N = T_years * n_per_year # Total number of periods
+    
+    total_payment = calculate_annuity_payment(P, r_p, N)
+    growth = 1 + r_p
     current_principal = P
     
     for k in range(1, N + 1):
         interest_payment = current_principal * r_p
-        principal_payment = total_payment - interest_payment
-        
-        schedule.append({
-            'period': k,
-            'initial_principal': current_principal,
-            'total_payment': total_payment,
-            'interest_payment': interest_payment,
-            'principal_payment': principal_payment
-        })
-        
-        total_interest += interest_payment
-        current_principal -= principal_payment
-        
-    return schedule, total_interest
+        yield k, current_principal, total_payment, interest_payment, total_payment - interest_payment
+        # B_k = B_{k-1} - (PMT - B_{k-1} * r_p) = B_{k-1} * (1+r_p) - PMT
+        current_principal = growth * current_principal - total_payment
 
+@lru_cache(maxsize=256)
 def calculate_effective_rate(r_pa, n_per_year):
     """
     Calculates the Effective Annual Rate (y) from the Nominal Rate (r)
     and compounding frequency (n).
 
     Formula: y = (1 + r/n)^n - 1
+    
+    Evaluated as expm1(n * log1p(r/n)) to avoid cancellation for small rates.
     """
-    y = math.pow(1 + r_pa / n_per_year, n_per_year) - 1
+    y = math.expm1(n_per_year * math.log1p(r_pa / n_per_year))
     return y
 
 def main():
@@ -104,12 +182,12 @@ def main():
     N_PER_YEAR = 4     # Compounding frequency (quarterly)
     
     # Equal Principal Payments
-    schedule1, interest1 = calculate_constant_principal_schedule(P_LOAN, R_NOMINAL, T_YEARS, N_PER_YEAR)
-    print_schedule("Equal Principal Payments", schedule1, interest1)
+    schedule1 = iter_constant_principal_schedule(P_LOAN, R_NOMINAL, T_YEARS, N_PER_YEAR)
+    interest1 = print_schedule("Equal Principal Payments", schedule1)
     
     # Equal Total Payments (Annuity)
-    schedule2, interest2 = calculate_annuity_schedule(P_LOAN, R_NOMINAL, T_YEARS, N_PER_YEAR)
-    print_schedule("Equal Total Payments (Annuity)", schedule2, interest2)
+    schedule2 = iter_annuity_schedule(P_LOAN, R_NOMINAL, T_YEARS, N_PER_YEAR)
+    interest2 = print_schedule("Equal Total Payments (Annuity)", schedule2)
 
     # Compute Effective Interest Rate (EIR) and Analysis 
     print("\nAnalysis: EIR and Favourability")
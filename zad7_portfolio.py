@@ -0,0 +1,62 @@
+"""
+Batch pricing of annuity loan portfolios for zad7.py.
+
+Kept apart from zad7.py so the schedule functions there can be used without numba.
+"""
+import math
+
+import numpy as np
+from numba import njit, prange
+
+# All fast-math flags except 'reassoc', which would let LLVM optimize the Kahan compensation away
+@njit(parallel=True, fastmath={'nnan', 'ninf', 'nsz', 'arcp', 'contract', 'afn'}, cache=True)
+def _portfolio_total_interest(P_arr, r_p_arr, N_arr, out):
+    """
+    Numba kernel behind calculate_portfolio_total_interest: writes the total interest of
+    annuity loan i into out[i], with loans spread across threads (NUMBA_NUM_THREADS).
+    
+    The balance follows B_k = B_{k-1} * (1+r_p) - PMT (one fused multiply-add per period) and
+    the interest is Kahan-summed, so long horizons do not accumulate rounding drift.
+    """
+    for i in prange(P_arr.shape[0]):
+        P = P_arr[i]
+        r_p = r_p_arr[i]
+        N = N_arr[i]
+        
+        denominator = -math.expm1(-N * math.log1p(r_p))
+        if denominator != 0:
+            total_payment = P * r_p / denominator
+        else:
+            total_payment = P / N # Handle zero interest case
+        
+        growth = 1 + r_p
+        current_principal = P
+        total_interest = 0.0
+        compensation = 0.0
+        for _ in range(N):
+            interest_payment = current_principal * r_p - compensation
+            t = total_interest + interest_payment
+            compensation = (t - total_interest) - interest_payment
+            total_interest = t
+            current_principal = growth * current_principal - total_payment
+        out[i] = total_interest
+
+def calculate_portfolio_total_interest(P, r_pa, T_years, n_per_year):
+    """
+    Calculates the total interest of every annuity loan in a portfolio.
+    
+    Arguments are arrays (or scalars broadcast against them) of loan parameters, one
+    element per loan, with the same meaning as in zad7.calculate_annuity_schedule.
+    Only the per-loan totals are kept, so no schedule is materialized. Returns a float
+    when all arguments are scalars.
+    """
+    P, r_pa, T_years, n_per_year = np.broadcast_arrays(P, r_pa, T_years, n_per_year)
+    P_arr = np.ascontiguousarray(P, dtype=np.float64).ravel()
+    r_p_arr = np.ascontiguousarray(r_pa / n_per_year, dtype=np.float64).ravel()
+    N_arr = np.ascontiguousarray(T_years * n_per_year, dtype=np.int64).ravel()
+    
+    out = np.empty(P_arr.shape[0], dtype=np.float64)
+    _portfolio_total_interest(P_arr, r_p_arr, N_arr, out)
+    if P.ndim == 0:
+        return float(out[0])
+    return out.reshape(P.shape)
@@ -4,6 +4,8 @@ Formulas derived for A/P = 2 with nominal annual rate r (R = r_decimal).
 """
 import math
 
+import numpy as np
+
 def t_simple(R: float) -> float:
     """Simple interest: A = P(1 + R t) -> t = 1/R"""
     if R <= 0:
@@ -14,7 +16,14 @@ def t_compound(R: float, n: float) -> float:
     """Compound interest n times per year: A = P(1 + R/n)^(n t) -> t = ln 2 / (n ln(1 + R/n))"""
     if R <= 0 or n <= 0:
         raise ValueError("R and n must be positive.")
-    return math.log(2.0) / (n * math.log(1.0 + R / n))
+    return math.log(2.0) / (n * math.log1p(R / n))
+
+def t_compound_table(R: float, ns: np.ndarray) -> np.ndarray:
+    """t_compound for an array of compounding frequencies, evaluated with one np.log1p call"""
+    ns = np.asarray(ns, dtype=np.float64)
+    if R <= 0 or np.any(ns <= 0):
+        raise ValueError("R and n must be positive.")
+    return np.log(2.0) / (ns * np.log1p(R / ns))
 
 def t_continuous(R: float) -> float:
     """Continuous compounding: A = P e^{Rt} -> t = ln 2 / R"""
@@ -26,6 +35,7 @@ if __name__ == "__main__":
     R = 0.05  # 5%
     print("r = 5% (R=0.05)")
     print(f"(a) Simple interest: t = {t_simple(R):.6f} years")
-    for n in [1, 4, 12, 365]:
-        print(f"(b) Compound n={n}/year: t = {t_compound(R, n):.6f} years")
+    ns = np.array([1, 4, 12, 365])
+    for n, t in zip(ns, t_compound_table(R, ns)):
+        print(f"(b) Compound n={n}/year: t = {t:.6f} years")
     print(f"(c) Continuous compounding: t = {t_continuous(R):.6f} years")
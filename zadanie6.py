@@ -29,18 +29,20 @@ Formulas used:
    This is for illustration only; it shows the timing effect (earlier cash is better).
 """
 
+import math
+from functools import lru_cache
 from typing import List
 
+import numpy as np
+
 def ear_variable_schedule(r_list: List[float]) -> float:
     # EAR for variable monthly nominal rates
     # uses formula (1): EAR = product (1 + r_i/12) - 1
-    factor = 1.0
-    for r in r_list:
-        # monthly compounding when month i has nominal annual rate r:
-        # monthly factor = (1 + r/12)
-        factor *= (1.0 + r/12.0)
+    # monthly compounding when month i has nominal annual rate r:
+    # monthly factor = (1 + r/12), multiplied over all months at once
+    factor = np.prod(1.0 + np.asarray(r_list)/12.0)
     # convert the 12-month factor into an effective annual rate by subtracting 1
-    return factor - 1.0
+    return float(factor - 1.0)
 
 def ear_constant(r: float) -> float:
     # EAR for a constant nominal annual rate r compounded monthly
@@ -53,14 +55,22 @@ def monthly_cashflows(r_list: List[float], principal: float = 1.0) -> List[float
     # return the list of 12 such payouts (one per month)
     return [principal * (r/12.0) for r in r_list]
 
+@lru_cache(maxsize=256)
+def _reinvestment_weights(months: int, monthly_rate: float) -> np.ndarray:
+    # growth factors (1 + m)^(months - k) for k = 1..months, i.e. (1 + m)^(months-1), ..., (1 + m)^0
+    # cached per (months, m) since the same reinvestment rate is reused for every schedule
+    weights = (1.0 + monthly_rate)**np.arange(months - 1, -1, -1)
+    weights.flags.writeable = False
+    return weights
+
 def future_value_of_monthly_cf(cashflows: List[float], monthly_rate: float) -> float:
     # future value at year end if monthly payouts are reinvested monthly at rate m
     # uses formula (4): FV = sum_{k=1.....12} cash_k * (1 + m)^(12 - k)
-    FV = 0.0
-    for k, c in enumerate(cashflows, start=1):
-        # cash c arrives at end of month k, so it compounds for (12 - k) months
-        FV += c * (1.0 + monthly_rate)**(12 - k)
-    return FV
+    # cash arriving at end of month k compounds for (12 - k) months, so FV is
+    # the sum of the cashflows times the growth factors, added up with math.fsum
+    # so the total is exactly rounded
+    weights = _reinvestment_weights(len(cashflows), monthly_rate)
+    return math.fsum((np.asarray(cashflows) * weights).tolist())
 
 if __name__ == "__main__":
     # A: rising schedule (month-specific nominal annual rates)
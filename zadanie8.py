@@ -1,55 +1,153 @@
-loan_amount = 500_000          # loan principal (PLN)
-years = 30                     # loan term in years
-months = years * 12            # total number of monthly installments (30 * 12 = 360)
-
-# e) monthly payment for the first 3 months
-# Interest rate: WIBOR3M 4.5% + margin 1% = 5.5% p.a.
-annual_rate_initial = 0.045 + 0.01          # 5.5% = 0.055
-monthly_rate_initial = annual_rate_initial / 12   # convert annual rate to monthly rate
-
-# Annuity (equal) payment formula:
-# A = P * r / (1 - (1 + r)^(-n))
-# where:
-# P - loan principal
-# r - monthly interest rate
-# n - number of payments
-P = loan_amount
-r = monthly_rate_initial
-n = months
-
-monthly_payment_initial = P * r / (1 - (1 + r) ** (-n))
-
-print("e) Monthly payment (first 3 months):", round(monthly_payment_initial, 2), "PLN")
-
-# f) outstanding balance after 3 months
-# Outstanding balance after k payments for an annuity loan:
-# B_k = P * (1 + r)^k - A * ((1 + r)^k - 1) / r
-# where:
-# B_k - balance after k months
-# k   - number of paid installments
-k = 3
-balance_after_3m = P * (1 + r) ** k - monthly_payment_initial * (((1 + r) ** k - 1) / r)
-
-print("f) Outstanding balance after 3 months:", round(balance_after_3m, 2), "PLN")
-
-# g) new monthly payment for the next 3 months (after rate change)
-# After 3 months WIBOR3M drops to 4%, so new annual rate = 4% + 1% = 5% p.a.
-annual_rate_new = 0.04 + 0.01     # 5% = 0.05
-monthly_rate_new = annual_rate_new / 12
-
-# Remaining term: 360 - 3 = 357 months
-remaining_months = months - k
-
-# We now recalculate the annuity payment using:
-# A_new = B * r_new / (1 - (1 + r_new)^(-n_remaining))
-# where:
-# B - outstanding balance after 3 months
-# r_new - new monthly interest rate
-# n_remaining - remaining number of installments
-B = balance_after_3m
-r_new = monthly_rate_new
-n_remaining = remaining_months
-
-monthly_payment_new = B * r_new / (1 - (1 + r_new) ** (-n_remaining))
-
-print("g) New monthly payment (months 4-6):", round(monthly_payment_new, 2), "PLN")
+import math
+from functools import lru_cache
+
+import numpy as np
+
+ZERO_RATE_EPS = 1e-15          # monthly rates below this are treated as zero interest
+
+
+def annuity_payment(P, r, n):
+    # Annuity (equal) payment formula:
+    # A = P * r / (1 - (1 + r)^(-n))
+    # where:
+    # P - loan principal
+    # r - monthly interest rate
+    # n - number of payments
+    # (1 + r)^(-n) is evaluated as exp(-n * log1p(r)), so 1 - (1 + r)^(-n) = -expm1(-n * log1p(r))
+    # does not lose precision to cancellation for small r.
+    # Works elementwise on NumPy arrays of rates as well as on plain floats; zero-rate
+    # scenarios are selected with np.where (limit r -> 0 gives P / n) instead of a branch.
+    r = np.asarray(r, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pmt = P * r / -np.expm1(-n * np.log1p(r))
+    return np.where(np.abs(r) < ZERO_RATE_EPS, P / n, pmt)
+
+
+def _annuity_payment_float(P, r, n):
+    # annuity_payment() for plain floats: same formula and zero-rate rule, without the array machinery
+    if abs(r) < ZERO_RATE_EPS:
+        return P / n
+    return P * r / -math.expm1(-n * math.log1p(r))
+
+
+def _solve_float(P, r, n, k, r_new):
+    # Plain-float body of solve(): monthly rates r, r_new, n installments, rate change after k of them.
+    pmt = _annuity_payment_float(P, r, n)
+    # B_k = P - (A - P * r) * ((1 + r)^k - 1) / r, see solve(); the growth sum tends to k as r -> 0
+    growth_sum = math.expm1(k * math.log1p(r)) / r if abs(r) >= ZERO_RATE_EPS else k
+    balance = P - (pmt - P * r) * growth_sum
+    return pmt, balance, _annuity_payment_float(balance, r_new, n - k)
+
+
+class Loan:
+    # Month-by-month view of an annuity loan, for simulating rate resets (e.g. quarterly WIBOR3M).
+    # Instead of re-evaluating (1 + r)^k at every reset, the growth factor is carried forward
+    # multiplicatively as the loan is stepped:
+    # gk = (1 + r)^k
+    # sk = ((1 + r)^k - 1) / r = 1 + (1 + r) + ... + (1 + r)^(k-1)
+    # so the balance B_k = P * gk - A * sk costs one multiply per month and needs no division by r.
+    # P, r may be NumPy arrays to step several scenarios together.
+
+    def __init__(self, P, r, n):
+        # P - loan principal, r - monthly interest rate, n - number of payments
+        self.P = P
+        self.r = r
+        self.n = n
+        self.pmt = annuity_payment(P, r, n)
+        self.k = 0
+        self.gk = 1.0
+        self.sk = 0.0
+        self._g = 1 + r
+
+    def step(self):
+        # pay one installment
+        self.sk = self.sk * self._g + 1
+        self.gk *= self._g
+        self.k += 1
+
+    @property
+    def balance(self):
+        # outstanding balance after the k installments paid so far
+        return self.P * self.gk - self.pmt * self.sk
+
+    def reset_rate(self, r_new):
+        # the rate changes: the outstanding balance is re-amortized over the remaining installments
+        self.P = self.balance
+        self.r = r_new
+        self.n -= self.k
+        self.pmt = annuity_payment(self.P, r_new, self.n)
+        self.k = 0
+        self.gk = 1.0
+        self.sk = 0.0
+        self._g = 1 + r_new
+
+
+def solve(loan, annual, margin, years, k, new_annual):
+    # loan       - loan principal (PLN)
+    # annual     - initial WIBOR3M rate, p.a.
+    # margin     - bank margin, p.a.
+    # years      - loan term in years
+    # k          - number of installments paid before the rate change
+    # new_annual - WIBOR3M rate after the change, p.a.
+    # 'annual', 'margin' and 'new_annual' may be NumPy arrays to sweep several scenarios in one call.
+    # Returns (initial payment, balance after k months, new payment): floats for scalar inputs,
+    # arrays (broadcast over the inputs) otherwise.
+    P = loan
+    n = years * 12                 # total number of monthly installments
+    r = (annual + margin) / 12     # convert annual rate to monthly rate
+    r_new = (new_annual + margin) / 12
+
+    # a single scenario stays in plain float arithmetic; NumPy is only used for sweeps
+    if all(isinstance(x, (int, float)) for x in (loan, annual, margin, new_annual)):
+        return _solve_float(P, r, n, k, r_new)
+
+    pmt = annuity_payment(P, r, n)
+
+    # Outstanding balance after k payments for an annuity loan:
+    # B_k = P * (1 + r)^k - A * ((1 + r)^k - 1) / r
+    # With (1 + r)^k - 1 = expm1(k * log1p(r)) computed once and shared by both terms:
+    # B_k = P - (A - P * r) * ((1 + r)^k - 1) / r
+    # ((1 + r)^k - 1) / r tends to k as r -> 0
+    gk_m1 = np.expm1(k * np.log1p(r))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth_sum = np.where(np.abs(r) < ZERO_RATE_EPS, k, gk_m1 / r)
+    balance = P - (pmt - P * r) * growth_sum
+
+    # We now recalculate the annuity payment on the outstanding balance
+    # for the remaining number of installments at the new rate.
+    pmt_new = annuity_payment(balance, r_new, n - k)
+
+    return tuple(np.broadcast_arrays(pmt, balance, pmt_new))
+
+
+@lru_cache(maxsize=256)
+def mortgage_payments(loan, r_init, r_new, years=30, reset_month=3):
+    # Specialized single-reset scenario (30 years, reset after 3 months by default), for sweeps
+    # that re-query the same scenarios: plain math arithmetic, memoized per argument tuple.
+    # loan   - loan principal (PLN)
+    # r_init - all-in annual rate (WIBOR3M + margin) before the reset, p.a.
+    # r_new  - all-in annual rate after the reset, p.a.
+    # Plain floats only (they are the cache key).
+    # Returns (initial payment, balance after reset_month months, new payment).
+    return _solve_float(loan, r_init / 12, years * 12, reset_month, r_new / 12)
+
+
+if __name__ == "__main__":
+    loan_amount = 500_000          # loan principal (PLN)
+    years = 30                     # loan term in years (30 * 12 = 360 installments)
+    k = 3                          # the rate changes after 3 months
+
+    # e) Interest rate: WIBOR3M 4.5% + margin 1% = 5.5% p.a.
+    # g) After 3 months WIBOR3M drops to 4%, so new annual rate = 4% + 1% = 5% p.a.
+    monthly_payment_initial, balance_after_3m, monthly_payment_new = solve(
+        loan=loan_amount,
+        annual=0.045,
+        margin=0.01,
+        years=years,
+        k=k,
+        new_annual=0.04
+    )
+
+    print("e) Monthly payment (first 3 months):", round(monthly_payment_initial, 2), "PLN")
+    print("f) Outstanding balance after 3 months:", round(balance_after_3m, 2), "PLN")
+    print("g) New monthly payment (months 4-6):", round(monthly_payment_new, 2), "PLN")
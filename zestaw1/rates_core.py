@@ -0,0 +1,21 @@
+import math
+
+from numba import vectorize
+
+@vectorize(["float64(float64, float64)"], cache=True)
+def periodic_from_effective(effective_rate, n):
+    """
+    Converts an effective rate over a whole term into the equivalent effective
+    rate per period, when the term is split into 'n' compounding periods.
+
+    The formula is derived from:
+    (1 + y_periodic)^n = (1 + effective_rate)
+
+    Solving for y_periodic:
+    y_periodic = (1 + effective_rate)^(1/n) - 1 = expm1(log1p(effective_rate) / n)
+
+    Shared by zestaw1/zad3.py and zad4.py, both of which import it as
+    zestaw1.rates_core. Compiled as a NumPy ufunc (cached on disk), so one native
+    kernel serves whole arrays of 'n' in a parameter sweep.
+    """
+    return math.expm1(math.log1p(effective_rate) / n)
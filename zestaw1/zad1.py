@@ -1,23 +1,24 @@
+import numpy as np
+
+
 def calculate_monthly_interest(start_balance, transactions, days_in_month, annual_rate):
 
     daily_rate = annual_rate / 365
-    total_interest = 0.0
-    current_balance = start_balance
-
-    processed_through_day = 0
-    sorted_transactions = dict(sorted(transactions.items()))
-    sorted_transactions[days_in_month + 1] = 0.0
 
-    for day, amount in sorted_transactions.items():
-        num_days = (day - 1) - processed_through_day
+    days = np.fromiter(transactions.keys(), dtype=np.int32, count=len(transactions))
+    amounts = np.fromiter(transactions.values(), dtype=np.float64, count=len(transactions))
+    order = np.argsort(days)
 
-        if num_days > 0:
-            interest_for_period = current_balance * daily_rate * num_days
-            total_interest += interest_for_period
+    # sentinel "transaction" on the day after the month ends closes the last period
+    days = np.append(days[order], days_in_month + 1)
+    amounts = np.append(amounts[order], 0.0)
 
-        current_balance += amount
-        processed_through_day = day - 1
+    # balance in effect before each transaction day, and how many days it was held
+    balances = start_balance + np.concatenate(([0.0], np.cumsum(amounts)))[:-1]
+    num_days = np.diff(np.concatenate(([0], days - 1)))
 
+    total_interest = float(np.dot(balances, num_days)) * daily_rate
+    current_balance = start_balance + float(amounts.sum())
 
     closing_balance = current_balance + total_interest
     return total_interest, closing_balance
@@ -1,5 +1,12 @@
 import math
+from functools import lru_cache
 
+import numpy as np
+
+# zestaw1 is a package: run this script from the repository root as `python -m zestaw1.zad3`
+from zestaw1.rates_core import periodic_from_effective
+
+@lru_cache(maxsize=256)
 def calculate_nominal_rate_discrete(inflation_rate, n):
     """
     Calculates the nominal interest rate 'r' required to achieve an
@@ -13,14 +20,31 @@ def calculate_nominal_rate_discrete(inflation_rate, n):
     (1 + inflation_rate)^(1/n) = 1 + r/n
     (1 + inflation_rate)^(1/n) - 1 = r/n
     r = n * ((1 + inflation_rate)^(1/n) - 1)
+    
+    (1 + inflation_rate)^(1/n) - 1 is evaluated as expm1(log1p(inflation_rate) / n),
+    which avoids cancellation when the per-period rate is close to zero.
     """
     if n <= 0:
         raise ValueError("Number of compounding periods 'n' must be positive.")
     
-    effective_rate_per_period = pow(1 + inflation_rate, 1/n)
-    r = n * (effective_rate_per_period - 1)
+    effective_rate_per_period = math.expm1(math.log1p(inflation_rate) / n)
+    r = n * effective_rate_per_period
     return r
 
+def calculate_nominal_rates_discrete(inflation_rate, ns):
+    """
+    Vectorized counterpart of calculate_nominal_rate_discrete: evaluates
+    r = n * ((1 + inflation_rate)^(1/n) - 1) for a whole array of
+    compounding frequencies 'ns' in a single pass of the compiled
+    rates_core.periodic_from_effective kernel.
+    """
+    ns = np.asarray(ns, dtype=np.float64)
+    if np.any(ns <= 0):
+        raise ValueError("Number of compounding periods 'n' must be positive.")
+    
+    return ns * periodic_from_effective(inflation_rate, ns)
+
+@lru_cache(maxsize=256)
 def calculate_nominal_rate_continuous(inflation_rate):
     """
     Calculates the nominal interest rate 'r' required to achieve an
@@ -34,7 +58,7 @@ def calculate_nominal_rate_continuous(inflation_rate):
     Solving for r:
     ln(1 + inflation_rate) = r
     """
-    r = math.log(1 + inflation_rate)
+    r = math.log1p(inflation_rate)
     return r
 
 def main():
@@ -51,8 +75,8 @@ def main():
     }
     
     # Discrete compounding
-    for name, n in compounding_periods.items():
-        rate = calculate_nominal_rate_discrete(INFLATION_RATE, n)
+    rates = calculate_nominal_rates_discrete(INFLATION_RATE, list(compounding_periods.values()))
+    for (name, n), rate in zip(compounding_periods.items(), rates):
         print(f"For {name:<12} (n={n:<3}) compounding, the required nominal rate r = {rate * 100:.4f}%")
         
     # Continuous compounding